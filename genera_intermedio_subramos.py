@@ -1,11 +1,8 @@
 import pandas as pd
-import numpy as np
 import sqlite3
 import logging
 import os
 from dotenv import load_dotenv
-from utils.db_functions import *
-from utils.other_functions import *
 
 load_dotenv()
 
@@ -20,38 +17,43 @@ database_path = 'revista_tr_database.db'
 # Obtengo base inicial
 def genero_dataframes(conn):
     base = pd.read_sql_query("SELECT * FROM datos_balance WHERE periodo in (202202,202203,202204,202301)", conn)
-    filtro = pd.read_sql_query("SELECT * FROM conceptos_reportes", conn)
-    params_full = pd.read_sql_query("SELECT * FROM parametros_reportes", conn)
-
-    parametros_reportes = params_full.merge(filtro, on=['reporte','referencia'], how='inner')
+    # El cruce de parámetros con conceptos se resuelve en SQLite, así solo viajan las cuentas usadas
+    parametros_reportes = pd.read_sql_query("""
+        SELECT p.reporte, p.referencia, p.cod_cuenta, p.signo, c.concepto
+        FROM parametros_reportes p
+        INNER JOIN conceptos_reportes c
+            ON p.reporte = c.reporte AND p.referencia = c.referencia
+        """, conn)
     filas, columnas = base.shape
-    logging.info(f"Se genero la base con {filas} filas")
+    logging.info("Se genero la base con %d filas", filas)
 
     return base, parametros_reportes
 
 
 def genero_resultado(data,codigos):
-    result = data.copy()
-
-    for i in list(codigos.keys()):
-            result[i] = result['cod_cuenta'].map(codigos[i]) * result['importe']
-
-    grouped = result.groupby(by=['cod_cia','periodo','cod_subramo'],
-                             as_index=False).agg(primas_emitidas = ('primas_emitidas','sum'), 
-                                                 primas_devengadas = ('primas_devengadas','sum'),
-                                                 siniestros_devengados = ('siniestros_devengados','sum'),
-                                                 gastos_totales_devengados = ('gastos_devengados','sum'))
+    # Matriz cuenta x concepto con el signo de cada cuenta (NaN si la cuenta no forma parte del concepto),
+    # solo con los conceptos que se suman
+    columnas = ['primas_emitidas', 'primas_devengadas', 'siniestros_devengados', 'gastos_devengados']
+    signos = pd.DataFrame(codigos)[columnas]
+
+    # Una sola búsqueda por cuenta resuelve todos los conceptos a la vez
+    importes = signos.reindex(data['cod_cuenta']).to_numpy() * data['importe'].to_numpy()[:, None]
+    result = pd.DataFrame(importes, columns=columnas, index=data.index)
+
+    grouped = result.groupby(by=[data['cod_cia'], data['periodo'], data['cod_subramo']]).sum()
+    grouped.reset_index(inplace=True)
+    grouped.rename(columns={'gastos_devengados': 'gastos_totales_devengados'}, inplace=True)
     logging.info("Base por subramos generada")
     return grouped
 
+conn = sqlite3.connect(database_path)
 base, parametros_reportes = genero_dataframes(conn)
 
 # Armar un diccionario con todas las claves que incluya las cuentas del PCU y sus respectivo signo
 codigos_map = {}
-for i in parametros_reportes['concepto'].unique():
-    codigos_map[i] = dict(zip(parametros_reportes[parametros_reportes['concepto'] == i]['cod_cuenta'],
-                        parametros_reportes[parametros_reportes['concepto'] == i]['signo']))
-    
+for concepto, grupo in parametros_reportes.groupby('concepto', sort=False):
+    codigos_map[concepto] = dict(zip(grupo['cod_cuenta'], grupo['signo']))
+
 
 final = genero_resultado(base,codigos_map)
 final.to_csv('reporte_subramos.csv',index=False)
@@ -1,8 +1,13 @@
 import pandas as pd
-import datetime
 
 import sqlite3
 
+# Reportes cuyos parámetros se cargan en la base
+REPORTES_INCLUIDOS = frozenset([
+    'anexo13-b', 'anexo14-b', 'anexo14-a', 'anexo13-a', 'resultados',
+    'anexo12-bm', 'anexo12-am', 'anexo16', 'anexo8-a', 'anexo11-a',
+    'ganaron-perdieron', 'nuevort', 'pasivo', 'inversiones'])
+
     
 def main():
     file_path = '/Users/diego.frigerio/Downloads/PARAMETROSREPORTES.txt'
@@ -15,12 +20,7 @@ def main():
     pm['reporte'] = pm['reporte'].str.strip()
     pm['referencia'] = pm['referencia'].str.lower()
 
-    keep = ['anexo13-b', 'anexo14-b', 'anexo14-a', 'anexo13-a', 'resultados',
-        'anexo12-bm', 'anexo12-am', 'anexo16', 'anexo8-a', 'anexo11-a',
-        'ganaron-perdieron', 'nuevort', 'pasivo','inversiones']
-
-    cd = pm.loc[pm['reporte'].isin(keep), ['reporte','referencia','codigo_completo','signo']]
-    cd.reset_index(inplace=True, drop=True)
+    cd = pm.loc[pm['reporte'].isin(REPORTES_INCLUIDOS), ['reporte','referencia','codigo_completo','signo']]
     cd.sort_values(by=['reporte','referencia'], inplace=True, ignore_index=True)
 
     cd.rename(columns={'codigo_completo':'cod_cuenta'}, inplace=True)
@@ -1,9 +1,7 @@
 import pandas as pd
-import numpy as np
-import datetime
 import os
 from dotenv import load_dotenv
-from utils.other_functions import *
+from utils.other_functions import TIPOS_DATOS_BALANCE, periodo_a_entero, quita_vacios, verificar_tipos
 import sqlite3
 
 
@@ -11,22 +9,14 @@ load_dotenv()
 
 database_path=os.getenv('DATABASE')
 
-tipos_esperados = {
-        'cod_cia': 'object',
-        'periodo': 'int64',
-        'cod_subramo': 'object',
-        'importe': 'int64',
-        'cod_cuenta': 'object'
-    }
-
 def main():
     # Create your connection.
     conn = sqlite3.connect(database_path)
 
     data = pd.read_sql_query("SELECT * FROM base", conn)
     data.columns = [x.lower() for x in data.columns]
-    data['periodo'] = data['periodo'].apply(lambda x: int(x.replace('-','0')))
-    data['cod_subramo'] = data['cod_subramo'].map(lambda x: quita_nulos(x))
+    data['periodo'] = periodo_a_entero(data['periodo'])
+    data['cod_subramo'] = quita_vacios(data['cod_subramo'])
 
     # SQL para crear la tabla
     create_table_sql = '''
@@ -39,12 +29,18 @@ def main():
     );
     '''
 
+    # Índice por período: las consultas siempre filtran por periodo
+    create_index_sql = '''
+    CREATE INDEX IF NOT EXISTS idx_datos_balance_periodo ON datos_balance (periodo);
+    '''
+
     # Ejecutar el comando para crear la tabla
     conn.execute(create_table_sql)
+    conn.execute(create_index_sql)
     # Confirmar (commit) la transacción y cerrar la conexión
     conn.commit()
 
-    if verificar_tipos(data, tipos_esperados):
+    if verificar_tipos(data, TIPOS_DATOS_BALANCE):
         data.to_sql('datos_balance', conn, if_exists='append', index=False)
     else:
         raise ValueError("Error en los datos luego de transformar")
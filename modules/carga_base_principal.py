@@ -1,24 +1,38 @@
 import pandas as pd
-import yaml
-import sqlite3
 import logging
 import os
+from pathlib import Path
 from dotenv import load_dotenv
-from utils.other_functions import *
-from utils.db_functions import insert_info,list_ultimos_periodos
+from utils.other_functions import (TIPOS_DATOS_BALANCE, cargar_config, df_from_mdb,
+                                   periodo_a_entero, quita_vacios, verificar_tipos)
+from utils.db_functions import crear_indice_periodo, insert_info, list_ultimos_periodos
 
 load_dotenv()
 
 database_path=os.getenv('DATABASE')
 
-with open("../config_for_load.yml", 'r') as file:
-        config = yaml.safe_load(file)
-    
+# Raíz del proyecto, para no depender del directorio desde donde se ejecuta
+_BASE_DIR = Path(__file__).resolve().parent.parent
+
+config = cargar_config(_BASE_DIR / "config_for_load.yml")
+
 # Extraer los valores del archivo YAML
 directorio = config['directorio']
 nombre_archivo_zip = config['nombre_archivo_zip']
 nombre_tabla = config['nombre_tabla']
 
+# Columnas del balance que se guardan en la base, el resto no se lee
+columnas_balance = ['cod_cia', 'periodo', 'cod_subramo', 'cod_cuenta', 'importe']
+
+# Tipos con los que se leen las columnas del balance, así pandas no los infiere
+tipos_lectura = {
+    'cod_cia': str,
+    'periodo': str,
+    'cod_subramo': str,
+    'cod_cuenta': str,
+    'importe': 'int64'
+}
+
 def load_and_transform_data(df:pd.DataFrame) -> pd.DataFrame:
     """
     Levanta el archivo .txt y lo transforma con las columnas necesarias para incorporarlo a la base de datos
@@ -28,41 +42,36 @@ def load_and_transform_data(df:pd.DataFrame) -> pd.DataFrame:
     Retorna:
     df: Dataframe ya transformado listo para subir.
     """
-    data = df.copy()
-    data.drop(columns={'razon_social', 'desc_subramo', 'desc_cuenta',
-                       'nivel', 'id_padre'}, inplace=True)
-    data['periodo'] = data['periodo'].apply(lambda x: int(x.replace('-', '0')))
-    data['cod_subramo'] = data['cod_subramo'].map(lambda x: quita_nulos(x))
+    # drop devuelve un DataFrame nuevo, no hace falta copiar df antes
+    data = df.drop(columns=df.columns.difference(columnas_balance))
+    data['periodo'] = periodo_a_entero(data['periodo'])
+    data['cod_subramo'] = quita_vacios(data['cod_subramo'])
     data['cod_cia'] = data['cod_cia'].astype(str).str.zfill(4)
     data = data[data['importe'] != 0]
     data.reset_index(inplace=True, drop=True)
-    tipos_esperados = {
-        'cod_cia': 'object',
-        'periodo': 'int64',
-        'cod_subramo': 'object',
-        'importe': 'int64',
-        'cod_cuenta': 'object'
-    }
 
-    if verificar_tipos(data, tipos_esperados):
+    if verificar_tipos(data, TIPOS_DATOS_BALANCE):
         return data
     else:
         raise ValueError("Error en los datos luego de transformar")
 
 if __name__ == "__main__":
+    crear_indice_periodo(database_path=database_path)
+
     # Primero chequeamos que el período no esté
     periodos = list_ultimos_periodos(database_path=database_path)
     nombre_archivo = os.path.splitext(os.path.basename(nombre_archivo_zip))[0]
     periodo_a_ingresar = int(nombre_archivo.replace("-", "0"))
     
     if periodo_a_ingresar not in periodos:
-        logging.info(f'Inicia carga de periodo {periodo_a_ingresar}')
-        df = df_from_mdb(directorio, nombre_archivo_zip, nombre_tabla)
+        logging.info('Inicia carga de periodo %s', periodo_a_ingresar)
+        df = df_from_mdb(directorio, nombre_archivo_zip, nombre_tabla,
+                         columnas=columnas_balance, tipos=tipos_lectura)
         df_for_database = load_and_transform_data(df=df)
         insert_info(data=df_for_database, 
                    database_path=database_path, 
                    table='datos_balance')
         filas, columnas = df_for_database.shape
-        logging.info(f"Se insertaron {filas} filas, para el archivo {nombre_archivo_zip}")
+        logging.info("Se insertaron %d filas, para el archivo %s", filas, nombre_archivo_zip)
     else:
-         logging.info(f'El período {periodo_a_ingresar} ya se encuentra en la base')
\ No newline at end of file
+         logging.info('El período %s ya se encuentra en la base', periodo_a_ingresar)
\ No newline at end of file
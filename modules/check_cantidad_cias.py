@@ -1,23 +1,25 @@
-import pandas as pd
-import yaml
-from utils.other_functions import df_from_mdb
+import os
+from pathlib import Path
+from utils.other_functions import cargar_config, df_from_mdb
 
-def main(config_path: str):
+# Raíz del proyecto, para no depender del directorio desde donde se ejecuta
+_BASE_DIR = Path(__file__).resolve().parent.parent
+
+def main(config_path: str | os.PathLike):
     # Leer el archivo de configuración YAML
-    with open(config_path, 'r') as file:
-        config = yaml.safe_load(file)
+    config = cargar_config(config_path)
     
     # Extraer los valores del archivo YAML
     directorio = config['directorio']
     nombre_archivo_zip = config['nombre_archivo_zip']
     nombre_tabla = config['nombre_tabla']
     
-    # Llamar a la función db_from_mdb con los valores del archivo YAML
-    df = df_from_mdb(directorio, nombre_archivo_zip, nombre_tabla)
+    # Llamar a la función db_from_mdb con los valores del archivo YAML, solo se necesita cod_cia
+    df = df_from_mdb(directorio, nombre_archivo_zip, nombre_tabla, columnas=['cod_cia'])
     
     # Realiza tus chequeos en el DataFrame `df`
     print(f"La tabla {nombre_tabla} tiene {df['cod_cia'].nunique()} compañias.")
 
 if __name__ == "__main__":
     # Llamar a main con la ruta al archivo de configuración YAML como argumento
-    main("../config/config_mdb.yml")
\ No newline at end of file
+    main(_BASE_DIR / "config" / "config_mdb.yml")
\ No newline at end of file
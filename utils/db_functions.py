@@ -16,6 +16,20 @@ def insert_info(data:pd.DataFrame, database_path:str, table:str):
     conn.close()
 
 
+def crear_indice_periodo(database_path:str):
+    """
+    Crea, si no existe, el índice por período de datos_balance. Las consultas siempre filtran
+    por periodo, así las bases ya existentes también lo tienen sin correr nada a mano.
+
+    Args:
+        database_path (str): Ruta al archivo de la base de datos SQLite.
+    """
+    conn = sqlite3.connect(database_path)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_datos_balance_periodo ON datos_balance (periodo)")
+    conn.commit()
+    conn.close()
+
+
 def load_dataframe(data: pd.DataFrame, database_path:str, table:str):
     """
     Carga un DataFrame en una tabla de SQLite, creando una nueva tabla o reemplazando la existente.
@@ -65,15 +79,14 @@ def list_ultimos_periodos(database_path:str):
        # Conexión a la base de datos SQLite
         conn = sqlite3.connect(database_path)
 
-        # Query
-        query = f"SELECT DISTINCT periodo FROM datos_balance WHERE periodo > {periodo_inicial}"
-        df = pd.read_sql_query(query, conn)
-
-        # Convertimos la columna 'periodo' del DataFrame en una lista y la retornamos
-        periodos_unicos = df['periodo'].tolist()
+        # Query, se lee directo del cursor: para una sola columna no hace falta un DataFrame
+        query = "SELECT DISTINCT periodo FROM datos_balance WHERE periodo > ?"
+        cursor = conn.execute(query, (periodo_inicial,))
+        periodos_unicos = [fila[0] for fila in cursor.fetchall()]
     
     except sqlite3.Error as e:
             print(f"Error al conectarse a la base de datos: {e}")
+            raise
     
     finally:
             # Cerrar la conexión
@@ -1,13 +1,40 @@
 import pandas as pd
-import numpy as np
 import os
 import subprocess
 import zipfile
 import logging
+import yaml
+from pathlib import Path
 
 # Configuración básica del logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Tipos que deben tener las columnas de datos_balance antes de insertarlas en la base
+TIPOS_DATOS_BALANCE = {
+    'cod_cia': 'object',
+    'periodo': 'int64',
+    'cod_subramo': 'object',
+    'importe': 'int64',
+    'cod_cuenta': 'object'
+}
+
+def cargar_config(config_path: str | os.PathLike) -> dict:
+    """
+    Lee el archivo YAML de configuración de carga. Un 'directorio' relativo se toma desde la
+    carpeta del propio archivo de configuración, no desde donde se ejecuta el script.
+
+    Args:
+        config_path (str | PathLike): Ruta al archivo de configuración.
+
+    Returns:
+        dict: Configuración con las claves 'directorio' (ya resuelto), 'nombre_archivo_zip' y 'nombre_tabla'.
+    """
+    with open(config_path, 'r') as file:
+        config = yaml.safe_load(file)
+    config['directorio'] = (Path(config_path).resolve().parent / config['directorio']).resolve()
+    return config
+
+
 def verificar_tipos(df:pd.DataFrame, tipos_esperados:dict) -> bool:
     """
     Verifica si los tipos de datos de las columnas en un DataFrame coinciden con los esperados.
@@ -23,27 +50,37 @@ def verificar_tipos(df:pd.DataFrame, tipos_esperados:dict) -> bool:
     return all(tipos_actuales[col] == tipo for col, tipo in tipos_esperados.items())
 
 
-def quita_nulos(x:pd.Series) -> (float | pd.Series):
+def periodo_a_entero(periodos: pd.Series) -> pd.Series:
+    """
+    Convierte los períodos con formato 'AAAA-T' al entero AAAA0T que se guarda en la base
+
+    Args:
+        periodos (pd.Series): Serie de strings con los períodos.
+
+    Returns:
+        pd.Series: Serie de enteros (int64).
+    """
+    return periodos.str.replace('-', '0', regex=False).astype('int64')
+
+
+def quita_vacios(serie: pd.Series) -> pd.Series:
     """
-    Remueve valores con string vacíos para reemplazarlos por Null
+    Reemplaza los strings vacíos y los None de toda la serie por Null
 
     Args:
-        x (Seres): _description_
+        serie (pd.Series): Serie a limpiar.
 
     Returns:
-        _type_: _description_
+        pd.Series: Serie con NaN en lugar de los strings vacíos y los None.
     """
-    if x == '' or x is None:
-        return np.nan
-    elif x is np.nan:
-        return x
-    else:
-        return x
+    return serie.mask(serie.isna() | (serie == ''))
 
 
 def df_from_mdb(directorio: str, 
                 nombre_archivo_zip: str, 
-                nombre_tabla: str) -> pd.DataFrame:
+                nombre_tabla: str,
+                columnas: list = None,
+                tipos: dict = None) -> pd.DataFrame:
     """
     Función para extraer datos de una tabla específica de un archivo .mdb
     que está dentro de un archivo .zip.
@@ -52,31 +89,42 @@ def df_from_mdb(directorio: str,
         directorio (str): Directorio donde se encuentra el archivo .zip.
         nombre_archivo_zip (str): Nombre del archivo .zip que contiene el archivo .mdb.
         nombre_tabla (str): Nombre de la tabla a extraer del archivo .mdb.
+        columnas (list, opcional): Columnas a leer, el resto se descarta al parsear.
+        tipos (dict, opcional): Tipos de datos por columna, evita que pandas los infiera.
     """
     archivo_zip_path = os.path.join(directorio, nombre_archivo_zip)
+    nombre_archivo_mdb = nombre_archivo_zip.replace(".zip", ".mdb")
     
-    # Descomprimir el archivo .zip para obtener el .mdb
+    # Descomprimir solo el .mdb, el resto del contenido del .zip no se usa
     with zipfile.ZipFile(archivo_zip_path, 'r') as zip_ref:
-        zip_ref.extractall(directorio)
-    archivo_mdb_path = os.path.join(directorio, nombre_archivo_zip.replace(".zip", ".mdb"))
-    
-    # Verificar si el archivo .mdb existe después de descomprimir
-    if not os.path.exists(archivo_mdb_path):
-        logging.error("No se encontró un archivo .mdb después de descomprimir.")
-        raise FileNotFoundError("No se encontró un archivo .mdb después de descomprimir.")
-    
-    logging.info(f"Archivo .mdb encontrado: {archivo_mdb_path}")
-    
-    # Exportar la tabla a un archivo CSV
-    output_csv = os.path.join(directorio, nombre_tabla + '.csv')
-    with open(output_csv, 'w') as outfile:
-        subprocess.call(['mdb-export', archivo_mdb_path, nombre_tabla], stdout=outfile)
-    logging.info(f"Tabla {nombre_tabla} exportada a CSV con éxito.")
+        if nombre_archivo_mdb in zip_ref.namelist():
+            zip_ref.extract(nombre_archivo_mdb, directorio)
+        else:
+            # No usar un .mdb que haya quedado en el directorio de una corrida anterior
+            logging.error("El archivo %s no contiene %s.", nombre_archivo_zip, nombre_archivo_mdb)
+            raise FileNotFoundError(f"El archivo {nombre_archivo_zip} no contiene {nombre_archivo_mdb}.")
+    archivo_mdb_path = os.path.join(directorio, nombre_archivo_mdb)
     
-    # Leer el CSV en un DataFrame de pandas
-    df = pd.read_csv(output_csv)
+    logging.info("Archivo .mdb encontrado: %s", archivo_mdb_path)
     
-    # Eliminar el archivo CSV después de su uso
-    os.remove(output_csv)
+    # Leer la salida de mdb-export directamente en un DataFrame, sin pasar por un CSV en disco
+    with subprocess.Popen(['mdb-export', archivo_mdb_path, nombre_tabla],
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE) as proceso:
+        try:
+            df = pd.read_csv(proceso.stdout, usecols=columnas, dtype=tipos)
+            error_lectura = None
+        except (pd.errors.EmptyDataError, pd.errors.ParserError) as error:
+            # Si mdb-export falla no suele escribir nada en stdout, el motivo se ve en su código de salida
+            error_lectura = error
+        # communicate espera a que termine el proceso y lee stderr sin bloquearse
+        _, errores = proceso.communicate()
+    if proceso.returncode != 0:
+        logging.error("mdb-export terminó con código %s al exportar la tabla %s: %s",
+                      proceso.returncode, nombre_tabla, errores.decode(errors='replace').strip())
+        raise subprocess.CalledProcessError(proceso.returncode, proceso.args,
+                                            stderr=errores) from error_lectura
+    if error_lectura is not None:
+        raise error_lectura
+    logging.info("Tabla %s exportada con éxito.", nombre_tabla)
     
     return df